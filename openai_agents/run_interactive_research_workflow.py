@@ -1,38 +1,98 @@
 import argparse
 import asyncio
+import sys
+import threading
 from pathlib import Path
+from time import time_ns
 from typing import Dict, List
 
-from temporalio.client import Client
+from temporalio.client import (
+    Client,
+    WithStartWorkflowOperation,
+    WorkflowExecutionStatus,
+    WorkflowFailureError,
+    WorkflowQueryFailedError,
+    WorkflowUpdateFailedError,
+    WorkflowUpdateRPCTimeoutOrCancelledError,
+)
+from temporalio.common import WorkflowIDConflictPolicy
 from temporalio.contrib.pydantic import pydantic_data_converter
+from temporalio.service import RPCError, RPCStatusCode
 
 from openai_agents.workflows.interactive_research_workflow import (
     InteractiveResearchWorkflow,
 )
 from openai_agents.workflows.research_agents.research_models import (
     ClarificationInput,
-    SingleClarificationInput,
     UserQueryInput,
 )
 
 
+def _can_abandon_prompt() -> bool:
+    """Whether a pending _read_line can be left unanswered at exit.
+
+    On a terminal input() reads through readline, so a daemon thread blocked
+    in it doesn't stop the interpreter shutting down. Any other stdin is read
+    through the buffered stdin object, and a thread blocked there holds its
+    lock and makes shutdown abort.
+    """
+    return sys.stdin.isatty()
+
+
+async def _read_line(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    On a terminal the read runs on a daemon thread so the prompt can be
+    abandoned; otherwise it runs on the default executor and must be awaited.
+    """
+    if not _can_abandon_prompt():
+        return await asyncio.to_thread(input, prompt)
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def resolve(line: str | None, error: Exception | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line or "")
+
+    def read() -> None:
+        try:
+            line, error = input(prompt), None
+        except Exception as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, line, error)
+        except RuntimeError:
+            pass  # Event loop already closed, nobody is waiting for the answer
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 async def run_interactive_research_with_clarifications(
     client: Client, query: str, workflow_id: str
 ):
     """Run interactive research with clarifying questions"""
     print(f"🤖 Starting interactive research: {query}")
 
-    # Check if workflow exists and is running
+    # Check if workflow exists and is running; its status doubles as the
+    # starting state for the Q&A loop so we don't query it a second time
     handle = None
-    start_new = True
+    status = None
 
     try:
-        handle = client.get_workflow_handle(workflow_id)
+        existing_handle = client.get_workflow_handle(workflow_id)
         print("Checking if workflow is already running...")
 
         try:
-            status = await handle.query(InteractiveResearchWorkflow.get_status)
-            if status and status.status not in [
+            existing_status = await existing_handle.query(
+                InteractiveResearchWorkflow.get_status
+            )
+            if existing_status and existing_status.status not in [
                 "completed",
                 "failed",
                 "timed_out",
@@ -40,7 +100,8 @@ async def run_interactive_research_with_clarifications(
                 "canceled",
             ]:
                 print("Found existing running workflow, using it...")
-                start_new = False
+                handle = existing_handle
+                status = existing_status
             else:
                 print("Existing workflow is not running, will start a new one...")
         except Exception:
@@ -49,28 +110,37 @@ async def run_interactive_research_with_clarifications(
     except Exception:
         print("Workflow not found, will start a new one...")
 
-    if start_new:
-        import time
-
-        unique_id = f"{workflow_id}-{int(time.time())}"
+    if handle is None:
+        unique_id = f"{workflow_id}-{time_ns()}"
         print(f"Starting new research workflow: {unique_id}")
+        print(f"🔄 Initiating research for: {query}")
 
-        # Start workflow with silent retry logic for network issues
-        handle = None
+        # Start the workflow and the research in a single round-trip with
+        # silent retry logic for network issues. USE_EXISTING and a fixed
+        # update id make a retry re-attach to the workflow and the
+        # start_research update an earlier attempt may already have sent.
         retry_timeout = 300  # 5 minutes total
         start_time = asyncio.get_event_loop().time()
 
         while True:
             try:
-                handle = await client.start_workflow(
+                start_op = WithStartWorkflowOperation(
                     InteractiveResearchWorkflow.run,
                     args=[None, False],
                     id=unique_id,
+                    id_conflict_policy=WorkflowIDConflictPolicy.USE_EXISTING,
                     task_queue="openai-agents-task-queue",
                 )
+                status = await client.execute_update_with_start_workflow(
+                    InteractiveResearchWorkflow.start_research,
+                    UserQueryInput(query=query),
+                    id=f"{unique_id}-start-research",
+                    start_workflow_operation=start_op,
+                )
+                handle = await start_op.workflow_handle()
                 break  # Success, exit retry loop
 
-            except Exception:
+            except (RPCError, WorkflowUpdateRPCTimeoutOrCancelledError):
                 # Check if we've exceeded the 5-minute timeout
                 elapsed_time = asyncio.get_event_loop().time() - start_time
                 if elapsed_time >= retry_timeout:
@@ -78,24 +148,41 @@ async def run_interactive_research_with_clarifications(
 
                 await asyncio.sleep(5)
 
-    if not handle:
-        raise RuntimeError("Failed to get workflow handle")
-
-    # Start the research process if it's a new workflow or not yet started
-    current_status = await handle.query(InteractiveResearchWorkflow.get_status)
-    if not current_status or current_status.status == "pending":
+    # Start the research process if the existing workflow has not started it yet
+    elif status is not None and status.status == "pending":
         print(f"🔄 Initiating research for: {query}")
-        await handle.execute_update(
+        status = await handle.execute_update(
             InteractiveResearchWorkflow.start_research, UserQueryInput(query=query)
         )
 
+    # Long-poll the workflow result in the background; the server holds this
+    # call open and answers it as soon as the workflow closes, so waiting on
+    # ``state_changed`` replaces fixed-interval sleeps between status queries.
+    state_changed = asyncio.Event()
+
+    def watch_result(delay: float = 0) -> asyncio.Task:
+        async def wait_for_result():
+            await asyncio.sleep(delay)
+            return await handle.result()
+
+        task = asyncio.create_task(wait_for_result())
+        task.add_done_callback(lambda _: state_changed.set())
+        return task
+
+    result_task = watch_result()
+
     # Interactive loop for Q&A
     while True:
         try:
-            status = await handle.query(InteractiveResearchWorkflow.get_status)
+            if status is None:
+                status = await handle.query(InteractiveResearchWorkflow.get_status)
 
             if not status:
-                await asyncio.sleep(1)
+                if result_task.done():
+                    break
+                await state_changed.wait()
+                state_changed.clear()
+                status = None
                 continue
 
             # States for asking questions
@@ -105,38 +192,79 @@ async def run_interactive_research_with_clarifications(
                 )
                 print("-" * 60)
 
-                while status.get_current_question() is not None:
-                    current_question = status.get_current_question()
-                    print(
-                        f"Question {status.current_question_index + 1} of {len(status.clarification_questions or [])}"
-                    )
-                    print(f"{current_question}")
-
-                    answer = input("Your answer: ").strip()
+                # Collect the remaining answers locally, keeping any already
+                # recorded by the workflow, then submit them in one update
+                questions = status.clarification_questions
+                responses = dict(status.clarification_responses)
+                workflow_completed = False
+
+                for index in range(status.current_question_index, len(questions)):
+                    print(f"Question {index + 1} of {len(questions)}")
+                    print(f"{questions[index]}")
+
+                    # On a terminal, keep watching the workflow while the user
+                    # types so we can stop straight away if it closes
+                    answer_task = asyncio.create_task(_read_line("Your answer: "))
+                    while _can_abandon_prompt() and not answer_task.done():
+                        await asyncio.wait(
+                            [answer_task, result_task],
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        if answer_task.done():
+                            break
+                        error = result_task.exception()
+                        if error is None:
+                            workflow_completed = True
+                            break
+                        if isinstance(error, WorkflowFailureError):
+                            answer_task.cancel()
+                            print("\nWorkflow closed while waiting for your answer.")
+                            return
+                        # The long-poll itself failed (e.g. server restart) but
+                        # the workflow may still be running, so watch it again
+                        result_task = watch_result(delay=2)
+
+                    if workflow_completed:
+                        answer_task.cancel()
+                        break
+                    try:
+                        answer = (await answer_task).strip()
+                    except EOFError:
+                        # stdin is closed (Ctrl-D or exhausted piped input), so
+                        # nobody is left to answer; end the session like "exit"
+                        # rather than letting the retry path prompt again
+                        answer = "exit"
 
                     if answer.lower() in ["exit", "quit", "end", "done"]:
                         print("Ending research session...")
                         await handle.signal(
                             InteractiveResearchWorkflow.end_workflow_signal
                         )
+                        result_task.cancel()
                         return  # Exit the function entirely
 
-                    status = await handle.execute_update(
-                        InteractiveResearchWorkflow.provide_single_clarification,
-                        SingleClarificationInput(
-                            question_index=status.current_question_index,
-                            answer=answer or "No specific preference",
-                        ),
-                    )
-                # After loop, all questions are answered, continue to outer loop to check new status
+                    responses[f"question_{index}"] = answer or "No specific preference"
+
+                if workflow_completed:
+                    break  # Go collect the result
+
+                status = await handle.execute_update(
+                    InteractiveResearchWorkflow.provide_clarifications,
+                    ClarificationInput(responses=responses),
+                )
+                # All questions are answered; the update already returned the
+                # new status, so continue the outer loop with it
 
             # Research has started, time to break the polling loop and wait
             elif status.status == "researching":
-                print("\n🔍 Research in progress...")
-                print("   📋 Planning searches")
-                print("   🌐 Gathering information from sources")
-                print("   ✍️  Compiling report")
-                print("   ⏳ Please wait...")
+                sys.stdout.write(
+                    "\n🔍 Research in progress...\n"
+                    "   📋 Planning searches\n"
+                    "   🌐 Gathering information from sources\n"
+                    "   ✍️  Compiling report\n"
+                    "   ⏳ Please wait...\n"
+                )
+                sys.stdout.flush()
                 # Break the interactive loop to wait for the final result
                 break
 
@@ -144,22 +272,60 @@ async def run_interactive_research_with_clarifications(
             elif status.status == "completed":
                 break
 
-            elif status.status == "pending":
-                print("⏳ Starting research...")
-                await asyncio.sleep(2)
-
             else:
-                print(f"📊 Unexpected Status: {status.status}, waiting...")
-                await asyncio.sleep(2)
+                if status.status == "pending":
+                    print("⏳ Starting research...")
+                else:
+                    print(f"📊 Unexpected Status: {status.status}, waiting...")
+                # Nothing the client does will move the workflow on from here,
+                # so wait for it to close rather than re-querying on a timer
+                await state_changed.wait()
+                break
 
         except Exception as e:
             print(f"❌ Error during interaction: {e}")
-            # If the workflow fails or is cancelled during interaction, we should exit
-            desc = await handle.describe()
-            if desc.status not in ("RUNNING", "CONTINUED_AS_NEW"):
-                print(f"Workflow has terminated with status: {desc.status}")
-                return
-            await asyncio.sleep(2)
+            status = None
+
+            # If the workflow fails or is cancelled during interaction, we should
+            # exit. Decide from what we already know where possible rather than
+            # making another call on a connection that may be broken.
+            if result_task.done():
+                error = result_task.exception()
+                if error is None:
+                    break  # Workflow completed, go collect the result
+                if isinstance(error, WorkflowFailureError):
+                    print(f"Workflow has terminated: {error.cause}")
+                    return
+                # The long-poll itself failed rather than the workflow, so
+                # start watching for the workflow to close again
+                result_task = watch_result()
+
+            elif isinstance(e, RPCError):
+                if e.status in (
+                    RPCStatusCode.NOT_FOUND,
+                    RPCStatusCode.FAILED_PRECONDITION,
+                ):
+                    print(f"Workflow is no longer running ({e.status.name})")
+                    result_task.cancel()
+                    return
+                # Anything else (e.g. server unavailable) is transient, and a
+                # describe() call would only fail the same way
+
+            elif not isinstance(
+                e, (WorkflowQueryFailedError, WorkflowUpdateFailedError)
+            ):
+                # Unknown failure, so ask the server whether the workflow is alive
+                desc = await handle.describe()
+                if desc.status not in (
+                    WorkflowExecutionStatus.RUNNING,
+                    WorkflowExecutionStatus.CONTINUED_AS_NEW,
+                ):
+                    print(f"Workflow has terminated with status: {desc.status}")
+                    result_task.cancel()
+                    return
+
+            # Back off before retrying, but wake early if the workflow closes
+            await asyncio.wait([result_task], timeout=2)
 
     # After breaking the loop, we wait for the final result with silent retry logic
     # This call will block until the workflow is complete.
@@ -170,7 +336,7 @@ async def run_interactive_research_with_clarifications(
 
     while True:
         try:
-            result = await handle.result()
+            result = await result_task
             break  # Success, exit retry loop
 
         except Exception:
@@ -182,33 +348,40 @@ async def run_interactive_research_with_clarifications(
             # Silent retry with exponential backoff
             await asyncio.sleep(retry_delay)
             retry_delay = min(retry_delay * 1.5, 5.0)  # Cap at 5 seconds
+            result_task = asyncio.create_task(handle.result())
 
     # The result now contains all the data we need
 
-    # Now that the wait is over, print the completion message and result.
-    print(f"\n🎉 Research completed!")
-
-    # Save markdown report
+    # Save markdown report, encoding it once so the same bytes are reused for stdout
+    report_bytes = result.markdown_report.encode("utf-8")
     markdown_file = Path("interactive_research_report.md")
-    markdown_file.write_text(result.markdown_report)
-    print(f"📄 Markdown report saved to: {markdown_file}")
-
-    # PDF report already saved by workflow
-    if result.pdf_file_path:
-        print(f"📑 PDF report saved to: {result.pdf_file_path}")
-    else:
-        print(f"⚠️  PDF generation not available (continuing with markdown only)")
-
-    # Show summary and follow-up questions if available
-    print(f"\n📋 Summary: {result.short_summary}")
-
-    print(f"\n🔍 Follow-up questions:")
-    for i, question in enumerate(result.follow_up_questions, 1):
-        print(f"   {i}. {question}")
-
-    print(f"\n📄 Research Result:")
-    print("=" * 60)
-    print(result.markdown_report)
+    markdown_file.write_bytes(report_bytes)
+
+    # Now that the wait is over, print the completion message and result,
+    # writing the summary in one go rather than a line at a time
+    lines = [
+        "\n🎉 Research completed!",
+        f"📄 Markdown report saved to: {markdown_file}",
+        # PDF report already saved by workflow
+        (
+            f"📑 PDF report saved to: {result.pdf_file_path}"
+            if result.pdf_file_path
+            else "⚠️  PDF generation not available (continuing with markdown only)"
+        ),
+        f"\n📋 Summary: {result.short_summary}",
+        "\n🔍 Follow-up questions:",
+        *(
+            f"   {i}. {question}"
+            for i, question in enumerate(result.follow_up_questions, 1)
+        ),
+        "\n📄 Research Result:",
+        "=" * 60,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(report_bytes)
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.flush()
     return result
 
 
@@ -258,12 +431,11 @@ async def send_clarifications(
 
 def parse_clarifications(clarification_args: List[str]) -> Dict[str, str]:
     """Parse clarification responses from command line arguments"""
-    responses = {}
-    for arg in clarification_args:
-        if "=" in arg:
-            key, value = arg.split("=", 1)
-            responses[key] = value
-    return responses
+    return {
+        key: value
+        for key, sep, value in (arg.partition("=") for arg in clarification_args)
+        if sep
+    }
 
 
 async def main():
@@ -317,9 +489,7 @@ async def main():
         # Handle new session flag
         workflow_id = args.workflow_id
         if args.new_session:
-            import time
-
-            workflow_id = f"{args.workflow_id}-{int(time.time())}"
+            workflow_id = f"{args.workflow_id}-{time_ns()}"
             print(f"🆕 Using new session ID: {workflow_id}")
 
         await run_interactive_research(client, args.query, workflow_id)
@@ -328,7 +498,7 @@ async def main():
         # Interactive query input
         print("🔍 OpenAI Interactive Research Workflow")
         print("=" * 40)
-        query = input("Enter your research query: ").strip()
+        query = (await _read_line("Enter your research query: ")).strip()
 
         if not query:
             print("❌ Query cannot be empty")
@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import sys
 from pathlib import Path
 
 from temporalio.client import Client
@@ -32,12 +33,15 @@ async def main():
         return
 
     query = args.query
-    print(f"🤖 Starting research: {query}")
-    print(f"🔍 Research in progress...")
-    print(f"   📋 Planning searches")
-    print(f"   🌐 Gathering information")
-    print(f"   ✍️  Compiling report")
-    print(f"   ⏳ Please wait...")
+    sys.stdout.write(
+        f"🤖 Starting research: {query}\n"
+        "🔍 Research in progress...\n"
+        "   📋 Planning searches\n"
+        "   🌐 Gathering information\n"
+        "   ✍️  Compiling report\n"
+        "   ⏳ Please wait...\n"
+    )
+    sys.stdout.flush()
 
     # Execute a workflow with silent retry logic for network issues
     result = None
@@ -64,22 +68,28 @@ async def main():
             await asyncio.sleep(5)
 
     if result:
-        print(f"\n🎉 Research completed!")
-
-        # Save markdown report
+        # Save markdown report, encoding it once so the same bytes are reused for stdout
+        report_bytes = result.markdown_report.encode("utf-8")
         markdown_file = Path("research_report.md")
-        markdown_file.write_text(result.markdown_report)
-        print(f"📄 Report saved to: {markdown_file}")
-
-        print(f"\n📋 Summary: {result.short_summary}")
-
-        print(f"\n🔍 Follow-up questions:")
-        for i, question in enumerate(result.follow_up_questions, 1):
-            print(f"   {i}. {question}")
-
-        print(f"\n📄 Research Result:")
-        print("=" * 60)
-        print(result.markdown_report)
+        markdown_file.write_bytes(report_bytes)
+
+        lines = [
+            "\n🎉 Research completed!",
+            f"📄 Report saved to: {markdown_file}",
+            f"\n📋 Summary: {result.short_summary}",
+            "\n🔍 Follow-up questions:",
+            *(
+                f"   {i}. {question}"
+                for i, question in enumerate(result.follow_up_questions, 1)
+            ),
+            "\n📄 Research Result:",
+            "=" * 60,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(report_bytes)
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":